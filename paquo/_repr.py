@@ -36,7 +36,12 @@ class _Tag(str):
         text = attrs.pop("text", None)
         default_style = default_style or {}
         if 'style' in attrs or default_style:
-            attrs['style'] = css(ChainMap(attrs.pop('style'), default_style))
+            style = attrs.pop('style')
+            if isinstance(style, str):
+                # allow passing pre-serialized css
+                attrs['style'] = f"{css(default_style)};{style}" if default_style else style
+            else:
+                attrs['style'] = css(ChainMap(style, default_style))
         # create the xml tag
         tag = Element(name, attrib=attrs)
         if text is not None:
@@ -16,6 +16,7 @@ from functools import cached_property as _cached_property
 from functools import partial
 from functools import total_ordering
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlsplit
 from urllib.request import urlopen
 from warnings import warn
@@ -30,10 +31,14 @@ __all__ = [
 ]
 
 
-# noinspection PyPep8Naming
-class cached_property(_cached_property):
-    def __set__(self, obj, value):
-        raise AttributeError(f"readonly attribute {self.attrname}")
+if TYPE_CHECKING:
+    # let type checkers see the generic functools.cached_property
+    cached_property = _cached_property
+else:
+    # noinspection PyPep8Naming
+    class cached_property(_cached_property):
+        def __set__(self, obj, value):
+            raise AttributeError(f"readonly attribute {self.attrname}")
 
 
 @total_ordering
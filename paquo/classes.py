@@ -116,10 +116,15 @@ class QuPathPathClass:
     @property
     def origin(self) -> 'QuPathPathClass':
         """the toplevel parent of this path class"""
-        origin_class = self
-        while origin_class.parent is not None:
-            origin_class = origin_class.parent
-        return origin_class
+        # walk the java objects to avoid creating intermediate wrappers
+        path_class = self.java_object
+        parent_class = path_class.getParentClass()
+        if parent_class is None:
+            return self
+        while parent_class is not None:
+            path_class = parent_class
+            parent_class = path_class.getParentClass()
+        return QuPathPathClass.from_java(path_class)
 
     def is_derived_from(self, parent_class: 'QuPathPathClass'):
         """is this class derived from the parent_class"""
@@ -6,6 +6,10 @@ from typing import Union
 from paquo.java import ColorTools
 from paquo.java import Integer
 
+# bound once, to skip the java class attribute lookup per conversion
+_make_rgb = ColorTools.makeRGB
+_make_rgba = ColorTools.makeRGBA
+
 ColorTypeRGB = Tuple[int, int, int]
 ColorTypeRGBA = Tuple[int, int, int, int]
 ColorType = Union[ColorTypeRGB, ColorTypeRGBA, 'QuPathColor', str]
@@ -64,32 +68,36 @@ class QuPathColor(NamedTuple):
 
     def to_java_rgb(self) -> Integer:
         """"convert to the java rgb integer representation used by qupath"""
-        return ColorTools.makeRGB(*self.to_rgb())
+        return _make_rgb(*self.to_rgb())
 
     @classmethod
     def from_java_rgb(cls, java_rgb: int) -> 'QuPathColor':
         """convert from java but ignore the alpha value in java_rgb"""
         if not isinstance(java_rgb, int):
             raise TypeError("requires an integer")
-        r = int(ColorTools.red(java_rgb))
-        g = int(ColorTools.green(java_rgb))
-        b = int(ColorTools.blue(java_rgb))
+        # unpack the (a)rgb channels in python, like ColorTools.red/green/blue
+        java_rgb = int(java_rgb)
+        r = (java_rgb >> 16) & 0xFF
+        g = (java_rgb >> 8) & 0xFF
+        b = java_rgb & 0xFF
         # noinspection PyArgumentList
         return cls(r, g, b)
 
     def to_java_rgba(self) -> Integer:
         """"convert to the java argb integer representation used by qupath"""
-        return ColorTools.makeRGBA(*self.to_rgba())
+        return _make_rgba(*self.to_rgba())
 
     @classmethod
     def from_java_rgba(cls, java_rgba: int) -> 'QuPathColor':
         """converts a java integer color into a QuPathColor instance"""
         if not isinstance(java_rgba, int):
             raise TypeError("requires an integer")
-        r = int(ColorTools.red(java_rgba))
-        g = int(ColorTools.green(java_rgba))
-        b = int(ColorTools.blue(java_rgba))
-        a = int(ColorTools.alpha(java_rgba))
+        # unpack the argb channels in python, like ColorTools.red/green/blue/alpha
+        java_rgba = int(java_rgba)
+        r = (java_rgba >> 16) & 0xFF
+        g = (java_rgba >> 8) & 0xFF
+        b = java_rgba & 0xFF
+        a = (java_rgba >> 24) & 0xFF
         # noinspection PyArgumentList
         return cls(r, g, b, a)
 
@@ -20,7 +20,6 @@ from typing import overload
 from paquo._logging import get_logger
 from paquo._utils import cached_property
 from paquo.classes import QuPathPathClass
-from paquo.java import GsonTools
 from paquo.java import IllegalArgumentException
 from paquo.java import PathAnnotationObject
 from paquo.java import PathDetectionObject
@@ -34,6 +33,7 @@ from paquo.pathobjects import QuPathPathAnnotationObject
 from paquo.pathobjects import QuPathPathCellObject
 from paquo.pathobjects import QuPathPathDetectionObject
 from paquo.pathobjects import QuPathPathTileObject
+from paquo.pathobjects import _gson
 from paquo.pathobjects import fix_geojson_geometry
 
 __all__ = ["QuPathPathObjectHierarchy"]
@@ -427,7 +427,7 @@ class QuPathPathObjectHierarchy:
 
     def to_geojson(self) -> list:
         """return all annotations as a list of geojson features"""
-        gson = GsonTools.getInstance()
+        gson = _gson()
         geojson = gson.toJson(self.java_object.getAnnotationObjects())
         return list(json.loads(str(geojson)))
 
@@ -447,6 +447,7 @@ class QuPathPathObjectHierarchy:
 
         requires_annotation_json_fix = compatibility.requires_annotation_json_fix()
 
+        gson = _gson()
         aos = []
         skipped: "CounterType[str]" = collections.Counter()
         for annotation in geojson:
@@ -483,7 +484,6 @@ class QuPathPathObjectHierarchy:
                         object_id = "PathAnnotationObject"
                     annotation['id'] = object_id
 
-                gson = GsonTools.getInstance()
                 if object_type == "annotation":
                     java_obj = gson.fromJson(String(json.dumps(annotation)), PathAnnotationObject)
                 elif object_type == "detection":
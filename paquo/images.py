@@ -1,15 +1,20 @@
 import json
+import os
 import pathlib
 import re
 import warnings
 import weakref
+from base64 import b64encode
 from collections.abc import MutableMapping
-from copy import deepcopy
+from contextlib import suppress
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from pathlib import PurePath
 from pathlib import PurePosixPath
 from pathlib import PureWindowsPath
+from string import ascii_letters
+from string import digits
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Dict
@@ -18,11 +23,19 @@ from typing import List
 from typing import Optional
 from typing import Union
 from urllib.parse import quote
+from urllib.parse import unquote
 from urllib.parse import urlsplit
 from urllib.parse import urlunsplit
 
 from paquo._logging import get_logger
 from paquo._logging import redirect
+from paquo._repr import br
+from paquo._repr import css
+from paquo._repr import div
+from paquo._repr import h4
+from paquo._repr import img
+from paquo._repr import p
+from paquo._repr import span
 from paquo._utils import cached_property
 from paquo.hierarchy import QuPathPathObjectHierarchy
 from paquo.java import URI
@@ -69,20 +82,70 @@ def __getattr__(name):
 #   broken URIs...
 #   For the sake of moving forward we go with the workarounds below.
 #   This should all be replaced with rfc3986 compliant URI handling.
+_URI_SAFE_CHARS = frozenset(ascii_letters + digits + "_.-~/:")
+_URI_PATH_SAFE_CHARS = _URI_SAFE_CHARS.union("@!$&'()*+,;=")
+_URI_CHARS = _URI_PATH_SAFE_CHARS.union("%")
+_RE_INVALID_ESCAPE = re.compile(r"%(?![0-9a-fA-F]{2})")
+
+
+def _is_windows_drive_path(path_str: str) -> bool:
+    """check if a uri path encodes a windows drive path: `/C:/...`"""
+    return (
+        len(path_str) > 4
+        and path_str[0] == "/"
+        and "A" <= path_str[1] <= "Z"
+        and path_str[2:4] == ":/"
+        and path_str[4] != "/"
+    )
+
+
+def _is_unc_share_path(path_str: str) -> bool:
+    """check if a uri path encodes a network share path: `//share/directory/...`"""
+    if not path_str.startswith("//"):
+        return False
+    idx_share = path_str.find("/", 2)
+    if idx_share <= 2:
+        return False
+    idx_directory = path_str.find("/", idx_share + 1)
+    return idx_directory > idx_share + 1
+
+
+def _is_unc_admin_share_path(path_str: str) -> bool:
+    """check if a uri path encodes a network admin share path: `//host/C$/...`"""
+    if not path_str.startswith("//"):
+        return False
+    idx_share = path_str.find("/", 2)
+    if idx_share <= 2:
+        return False
+    share = path_str[idx_share + 1:idx_share + 4]
+    return len(share) == 3 and share[0] in ascii_letters and share[1:] == "$/"
+
+
 def _normalize_pathlib_uris(uri):
     """this will correctly unescape and normalize uri's received from pathlib.Path.as_uri()"""
     # https://docs.oracle.com/javase/7/docs/api/java/net/URI.html section Identities
     try:
         u = URI(uri)
-    except URISyntaxException:
+    except URISyntaxException as err:
+        if _URI_SAFE_CHARS.issuperset(uri):
+            # all of these characters are valid in a uri path, so the syntax
+            # error is not in the path and quoting it can't repair the uri
+            raise ValueError(f"uri not valid '{uri}'") from err
         try:
             s = urlsplit(uri)
-            s = s._replace(path=quote(s.path))
-            uri = urlunsplit(s)
         except ValueError:
             raise ValueError(f"uri not valid '{uri}'")
-        else:
+        if _URI_PATH_SAFE_CHARS.issuperset(s.path):
+            # the path is valid as is (quote() would still escape some of these
+            # characters), so the syntax error is elsewhere and the quoted retry
+            # would fail as well. Raise early instead of re-parsing on the java side
+            raise ValueError(f"uri not valid '{uri}'") from err
+        s = s._replace(path=quote(s.path))
+        uri = urlunsplit(s)
+        try:
             u = URI(uri)
+        except URISyntaxException:
+            raise ValueError(f"uri not valid '{uri}'") from err
     scheme = u.getScheme()
     if scheme != "file":
         raise ValueError(f"uri unsupported scheme '{uri}'")
@@ -90,7 +153,7 @@ def _normalize_pathlib_uris(uri):
     path = str(u.getPath())
     if host:
         path = f"////{host}{path}"
-    elif re.match("^//[^/]+/[a-zA-Z][$]/", path):
+    elif _is_unc_admin_share_path(path):
         path = f"//{path}"
     try:
         x = URI(
@@ -107,6 +170,36 @@ def _normalize_pathlib_uris(uri):
     return x
 
 
+def _file_uri_path(uri: str) -> Optional[str]:
+    """pure python fast path for decoding the path of simple local file uris
+
+    returns None if the uri requires the java uri parser, i.e. if it
+    has a host, a query, a fragment, or contains unescaped characters.
+    """
+    if not uri.startswith("file:/") or not _URI_CHARS.issuperset(uri):
+        return None
+    path = uri[5:]
+    if path.startswith("//"):
+        if path[2:3] != "/":
+            return None  # uri has an authority
+        path = path[2:]
+    if _RE_INVALID_ESCAPE.search(path):
+        return None
+    try:
+        path = unquote(path, errors="strict")
+    except UnicodeDecodeError:
+        return None
+    if path.startswith("//"):
+        return None  # network shares are handled by java
+    return path
+
+
+@lru_cache(maxsize=1024)
+def _normalized_uri_str(uri: str) -> str:
+    """cached string representation of a normalized uri"""
+    return str(_normalize_pathlib_uris(uri))
+
+
 SimpleFileImageId = Union[str, pathlib.Path]
 
 
@@ -127,10 +220,25 @@ class ImageProvider:
 
     class URIString(str):
         """string uri's can differ in their string representation and still be identical"""
-        # we need some way to normalize uris
-        def __eq__(self, other):  # pragma: no cover
+
+        def __new__(cls, value):
+            # normalize once, so that the string itself is canonical and
+            # comparisons and hashing stay consistent with plain str
+            try:
+                value = _normalized_uri_str(str(value))
+            except ValueError:
+                pass
+            return super().__new__(cls, value)
+
+        def __eq__(self, other):
+            if isinstance(other, ImageProvider.URIString):
+                return str.__eq__(self, other)
             return ImageProvider.compare_uris(self, other)
-        __hash__ = str.__hash__  # fixme: this is not correct!
+
+        def __ne__(self, other):
+            return not self.__eq__(other)
+
+        __hash__ = str.__hash__
 
     def uri(self, image_id: SimpleFileImageId) -> Optional['URIString']:
         """accepts a path and returns a URIString"""
@@ -138,9 +246,8 @@ class ImageProvider:
             raise TypeError("image_id not of correct format")  # pragma: no cover
         if isinstance(image_id, str) and image_id.startswith("file:/"):
             # image_id is uri
-            image_id = _normalize_pathlib_uris(image_id)
-            return ImageProvider.URIString(image_id)
-        img_path = pathlib.Path(image_id).absolute().resolve()
+            return ImageProvider.URIString(_normalized_uri_str(str(image_id)))
+        img_path = pathlib.Path(image_id).resolve()  # resolve() makes the path absolute
         if not img_path.is_file():
             return None
         return ImageProvider.URIString(img_path.as_uri())
@@ -153,7 +260,10 @@ class ImageProvider:
 
     def rebase(self, *uris: str, **kwargs) -> List[Optional[str]]:
         uri2uri = kwargs.pop('uri2uri', {})
-        return [uri2uri.get(uri, None) for uri in uris]
+        # normalize the mapping once, so lookups are plain dict hits
+        uri_string = ImageProvider.URIString
+        lookup = {uri_string(k): v for k, v in uri2uri.items()}
+        return [lookup.get(uri_string(uri), None) for uri in uris]
 
     @staticmethod
     def path_from_uri(uri: str) -> PurePath:
@@ -161,22 +271,24 @@ class ImageProvider:
         Parses an URI representing a file system path into a Path.
         """
         # TODO: needs way more tests... See note [URI:java-python]
-        java_uri = _normalize_pathlib_uris(uri)
-        # test current scheme support
-        if str(java_uri.getScheme()) != "file":
-            raise NotImplementedError("paquo only supports file:/ URIs as of now")
-        else:
-            path_str = str(java_uri.getPath())
+        path_str = _file_uri_path(uri)
+        if path_str is None:
+            java_uri = _normalize_pathlib_uris(uri)
+            # test current scheme support
+            if str(java_uri.getScheme()) != "file":
+                raise NotImplementedError("paquo only supports file:/ URIs as of now")
+            else:
+                path_str = str(java_uri.getPath())
 
-        host = java_uri.getHost()
-        if host:
-            path_str = f"//{host}{path_str}"
+            host = java_uri.getHost()
+            if host:
+                path_str = f"//{host}{path_str}"
 
         # fixme: this should be replaced with something more reliable...
         # check if we encode a windows path
-        if re.match(r"/[A-Z]:/[^/]", path_str):
+        if _is_windows_drive_path(path_str):
             return PureWindowsPath(path_str[1:])
-        elif re.match(r"//(?P<share>[^/]+)/(?P<directory>[^/]+)/", path_str):
+        elif _is_unc_share_path(path_str):
             return PureWindowsPath(path_str)
         else:
             return PurePosixPath(path_str)
@@ -189,9 +301,9 @@ class ImageProvider:
         # TODO: needs way more tests... See note [URI:java-python]
         if not path.is_absolute():
             raise ValueError("uri_from_path requires an absolute path")
-        java_uri = str(_normalize_pathlib_uris(path.as_uri()).toString())
+        java_uri = _normalized_uri_str(path.as_uri())
         # fixme: this should be replaced with a rfc3896 compliant solution...
-        if re.match("file://([^/]|$)", java_uri):
+        if java_uri.startswith("file://") and java_uri[7:8] != "/":
             uri = f"file:////{java_uri[7:]}"  # network shares have redundant authority on the java side
         # vvv this would only be required if we wouldn't normalize the uri like above
         # elif re.match("file:///([^/]|$)", java_uri):
@@ -206,42 +318,20 @@ class ImageProvider:
         Test if two URIs point two the same resource
         """
         # TODO: needs way more tests... See note [URI:java-python]
-        uri_a = _normalize_pathlib_uris(a)
-        uri_b = _normalize_pathlib_uris(b)
-        return bool(uri_a.equals(uri_b))
+        if str.__eq__(a, b) is True:
+            # identical strings don't require a roundtrip through java
+            # note: str.__eq__ prevents recursing via URIString.__eq__
+            return True
+        # note: normalized uris are canonical. They carry no authority (hosts
+        #   are moved into the path) and java re-escapes with uppercase hex
+        #   digits, so string equality matches `java.net.URI.equals`
+        return _normalized_uri_str(str(a)) == _normalized_uri_str(str(b))
 
 
 # noinspection PyPep8Naming
 class _RecoveredReadOnlyImageServer:
     """internal. used to allow access to image server metadata recovered from project.qpproj"""
 
-    # noinspection PyMethodParameters,PyPep8Naming
-    class _FakeResolutionLevel:
-        def __init__(self_, _lvl):
-            self_._lvl = _lvl
-
-        def getDownsample(self_):
-            return self_._lvl['downsample']
-
-        def getHeight(self_):
-            return self_._lvl['height']
-
-        def getWidth(self_):
-            return self_._lvl['width']
-
-    # noinspection PyMethodParameters,PyPep8Naming
-    class _FakeMetadata:
-        def __init__(self_, _metadata):
-            self_._md = _metadata
-
-        def nLevels(self_):
-            return len(self_._md.get('levels', []))
-
-        def getLevel(self_, idx):
-            _rl = self_._md.get('levels')[idx]
-            # noinspection PyProtectedMember
-            return _RecoveredReadOnlyImageServer._FakeResolutionLevel(_rl)
-
     def __init__(self, entry_path: Path):
         server_json_f = Path(entry_path) / "server.json"
         with server_json_f.open('r') as f:
@@ -262,11 +352,16 @@ class _RecoveredReadOnlyImageServer:
     def nTimepoints(self):
         return self._metadata['sizeT']
 
-    def getMetadata(self) -> Any:
-        # fake the java metadata interface
-        _md = deepcopy(self._metadata)
-        # noinspection PyProtectedMember
-        return _RecoveredReadOnlyImageServer._FakeMetadata(_md)
+    def downsample_levels(self) -> List[Dict[str, float]]:
+        # levels as stored in the recovered server.json metadata
+        return [
+            {
+                'downsample': float(lvl['downsample']),
+                'width': int(lvl['width']),
+                'height': int(lvl['height']),
+            }
+            for lvl in self._metadata.get('levels', [])
+        ]
 
 
 class _ProjectImageEntryMetadata(MutableMapping):
@@ -284,7 +379,7 @@ class _ProjectImageEntryMetadata(MutableMapping):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
         if not isinstance(v, str):
             raise TypeError(f"value must be of type `str` got `{type(v)}`")
-        self._entry.putMetadataValue(String(str(k)), String(str(v)))
+        self._entry.putMetadataValue(k, v)
 
     def __delitem__(self, k: str) -> None:
         # noinspection PyProtectedMember
@@ -292,12 +387,12 @@ class _ProjectImageEntryMetadata(MutableMapping):
             raise AttributeError("project in readonly mode")
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
-        self._entry.removeMetadataValue(String(str(k)))
+        self._entry.removeMetadataValue(k)
 
     def __getitem__(self, k: str) -> str:
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
-        v = self._entry.getMetadataValue(String(str(k)))
+        v = self._entry.getMetadataValue(k)
         if v is None:
             raise KeyError(f"'{k}' not in metadata")
         return str(v)
@@ -309,7 +404,9 @@ class _ProjectImageEntryMetadata(MutableMapping):
         return iter(map(str, self._entry.getMetadataKeys()))
 
     def __contains__(self, item):
-        return bool(self._entry.containsMetadata(String(str(item))))
+        if not isinstance(item, str):
+            return False
+        return bool(self._entry.containsMetadata(item))
 
     def clear(self) -> None:
         # noinspection PyProtectedMember
@@ -317,8 +414,15 @@ class _ProjectImageEntryMetadata(MutableMapping):
             raise AttributeError("project in readonly mode")
         self._entry.clearMetadata()
 
+    def _as_dict(self) -> Dict[str, str]:
+        """internal: read all metadata with a single pass over the entries"""
+        return {
+            str(e.getKey()): str(e.getValue())
+            for e in self._entry.getMetadataMap().entrySet()
+        }
+
     def __repr__(self):
-        return f"Metadata({repr(dict(self))})"
+        return f"Metadata({repr(self._as_dict())})"
 
 
 class _ImageDataProperties(MutableMapping):
@@ -335,7 +439,7 @@ class _ImageDataProperties(MutableMapping):
             raise AttributeError("project in readonly mode")
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
-        self._image_data.setProperty(String(k), v)
+        self._image_data.setProperty(k, v)
 
     def __delitem__(self, k: str) -> None:
         # noinspection PyProtectedMember
@@ -343,14 +447,14 @@ class _ImageDataProperties(MutableMapping):
             raise AttributeError("project in readonly mode")
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
-        self._image_data.removeProperty(String(k))
+        self._image_data.removeProperty(k)
 
     def __getitem__(self, k: str) -> Any:
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
         if k not in self:
             raise KeyError(f"'{k}' not in metadata")
-        v = self._image_data.getProperty(String(k))
+        v = self._image_data.getProperty(k)
         return v
 
     def __contains__(self, item: Any) -> bool:
@@ -364,7 +468,7 @@ class _ImageDataProperties(MutableMapping):
         return int(self._image_data.getProperties().size())
 
     def __iter__(self) -> Iterator[str]:
-        return iter(map(str, dict(self._image_data.getProperties())))
+        return iter(map(str, self._image_data.getProperties().keySet()))
 
     def __repr__(self):
         return f"Properties({repr(dict(self))})"
@@ -386,10 +490,10 @@ class QuPathImageType(str, Enum):
     @classmethod
     def from_java(cls, java_enum) -> 'QuPathImageType':
         """internal for converting from java to python"""
-        for value in cls.__members__.values():
-            if value.java_enum == java_enum:
-                return value
-        raise ValueError("unsupported java_enum")  # pragma: no cover
+        try:
+            return _JAVA_IMAGE_TYPE_MAP[java_enum]
+        except KeyError:  # pragma: no cover
+            raise ValueError("unsupported java_enum")
 
     # Brightfield image with hematoxylin and DAB stains.
     BRIGHTFIELD_H_DAB = ("Brightfield (H-DAB)", ImageType.BRIGHTFIELD_H_DAB)
@@ -405,6 +509,43 @@ class QuPathImageType(str, Enum):
     UNSET = ("Not set", ImageType.UNSET)
 
 
+_JAVA_IMAGE_TYPE_MAP = {
+    member.java_enum: member for member in QuPathImageType.__members__.values()
+}
+
+
+# required for reading thumbnails via os.open on windows
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# pre-serialized css used in QuPathProjectImageEntry._repr_html_
+_THUMBNAIL_IMG_CSS = css({
+    "max-width": "100px",
+    "max-height": "100px",
+    "border": "1px solid",
+    "margin": "auto",
+})
+_THUMBNAIL_HEADER_CSS = css({
+    "position": "absolute",
+    "top": "-1.6em",
+    "width": "100px",
+    "overflow": "hidden",
+    "text-overflow": "ellipsis",
+    "font-size": "0.75em",
+})
+_THUMBNAIL_CONTAINER_CSS = css({
+    "display": "flex",
+    "align-items": "center",
+    "justify-content": "center",
+    "position": "relative",
+    "width": "100px",
+    "height": "100px",
+    "background": "#ddd",
+    "margin": "2px",
+})
+_THUMBNAIL_CONTAINER_COMPACT_CSS = f"{_THUMBNAIL_CONTAINER_CSS};margin-top:1em"
+_THUMBNAIL_MISSING_CSS = css({"font-size": "3em"})
+
+
 class QuPathProjectImageEntry:
     java_object: DefaultProjectImageEntry
 
@@ -459,26 +600,35 @@ class QuPathProjectImageEntry:
                 raise
         return server
 
-    @property
+    @cached_property
     def entry_id(self) -> str:
         """the unique image entry id"""
         return str(self.java_object.getID())
 
-    @property
+    @cached_property
     def entry_path(self) -> Path:
         """path to the image directory"""
-        return Path(str(self.java_object.getEntryPath().toString()))
+        return Path(str(self.java_object.getEntryPath()))
+
+    @cached_property
+    def _image_name(self) -> str:
+        return str(self.java_object.getImageName())
+
+    def _image_name_invalidate_cache(self):
+        with suppress(KeyError):
+            del self.__dict__["_image_name"]
 
     @property
     def image_name(self) -> str:
         """the image entry name"""
-        return str(self.java_object.getImageName())
+        return self._image_name
 
     @image_name.setter
     def image_name(self, name: str) -> None:
         if self._readonly:
             raise AttributeError("project in readonly mode")
-        self.java_object.setImageName(String(name))
+        self.java_object.setImageName(name)
+        self._image_name_invalidate_cache()
 
     # remove until there's a good use case for this...
     # @property
@@ -548,16 +698,21 @@ class QuPathProjectImageEntry:
         The available downsample levels can differ dependent
         on which image backend is used by QuPath
         """
-        with redirect(stdout=True, stderr=True):
-            md = self._image_server.getMetadata()
-        levels = []
-        for level in range(int(md.nLevels())):
-            resolution_level = md.getLevel(level)
-            levels.append({
-                'downsample': float(resolution_level.getDownsample()),
-                'width': int(resolution_level.getWidth()),
-                'height': int(resolution_level.getHeight()),
-            })
+        server = self._image_server
+        if isinstance(server, _RecoveredReadOnlyImageServer):
+            levels = server.downsample_levels()
+        else:
+            with redirect(stdout=True, stderr=True):
+                md = server.getMetadata()
+            get_level = md.getLevel
+            levels = []
+            for level in range(int(md.nLevels())):
+                resolution_level = get_level(level)
+                levels.append({
+                    'downsample': float(resolution_level.getDownsample()),
+                    'width': int(resolution_level.getWidth()),
+                    'height': int(resolution_level.getHeight()),
+                })
         return levels
 
     @property
@@ -602,63 +757,32 @@ class QuPathProjectImageEntry:
         return f"ImageEntry(image_name='{self.image_name}')"
 
     def _repr_html_(self, compact=False, index=0):
-        from base64 import b64encode
-
-        from paquo._repr import br
-        from paquo._repr import div
-        from paquo._repr import h4
-        from paquo._repr import img
-        from paquo._repr import p
-        from paquo._repr import span
-
-        img_css = {
-            "max-width": "100px",
-            "max-height": "100px",
-            "border": "1px solid",
-            "margin": "auto",
-        }
-        header_css = {
-            "position": "absolute",
-            "top": "-1.6em",
-            "width": "100px",
-            "overflow": "hidden",
-            "text-overflow": "ellipsis",
-            "font-size": "0.75em",
-        }
-        container_css = {
-            "display": "flex",
-            "align-items": "center",
-            "justify-content": "center",
-            "position": "relative",
-            "width": "100px",
-            "height": "100px",
-            "background": "#ddd",
-            "margin": "2px",
-        }
-
+        image_name = self.image_name
         try:
-            with (self.entry_path / "thumbnail.jpg").open(mode="rb") as f:
-                data = b64encode(f.read()).decode('utf-8')
-        except FileNotFoundError:  # pragma: no cover
-            image = span(style={"font-size": "3em"}, text="?")
+            fd = os.open(os.path.join(self.entry_path, "thumbnail.jpg"), os.O_RDONLY | _O_BINARY)
+            try:
+                data = b64encode(os.read(fd, os.fstat(fd).st_size)).decode('ascii')
+            finally:
+                os.close(fd)
+        except OSError:  # pragma: no cover
+            image = span(style=_THUMBNAIL_MISSING_CSS, text="?")
         else:
-            image = img(title=self.image_name,
+            image = img(title=image_name,
                         src=f"data:image/jpeg;base64,{data}",
-                        style=img_css)
+                        style=_THUMBNAIL_IMG_CSS)
         if compact:
-            container_css["margin-top"] = "1em"
             return div(
-                span(text=f"[{index}]\xa0{self.image_name}", style=header_css),
+                span(text=f"[{index}]\xa0{image_name}", style=_THUMBNAIL_HEADER_CSS),
                 image,
-                style=container_css
+                style=_THUMBNAIL_CONTAINER_COMPACT_CSS
             )
 
         try:
-            uri = self.uri[5:]
+            uri = self._uri[5:]
         except RuntimeError as err:  # pragma: no cover
             uri = f"N/A ({err})"
         return div(
-            h4(text=f"Image: {self.image_name}", style={"margin-top": "0"}),
+            h4(text=f"Image: {image_name}", style={"margin-top": "0"}),
             p(
                 span(text="path: ", style={"font-weight": "bold"}),
                 span(text=uri),
@@ -669,7 +793,7 @@ class QuPathProjectImageEntry:
             ),
             div(
                 image,
-                style=container_css,
+                style=_THUMBNAIL_CONTAINER_CSS,
             )
         )
 
@@ -681,12 +805,25 @@ class QuPathProjectImageEntry:
             raise RuntimeError("no server")  # pragma: no cover
         elif len(uris) > 1:
             raise NotImplementedError("unsupported in paquo as of now")
-        return str(uris[0].toString())
+        return str(uris[0])
+
+    @cached_property
+    def _uri(self) -> str:
+        return str(self.uri)
+
+    @cached_property
+    def _concrete_path(self) -> Path:
+        return Path(ImageProvider.path_from_uri(self._uri))
+
+    def _uri_invalidate_cache(self):
+        with suppress(KeyError):
+            del self.__dict__["_uri"]
+        with suppress(KeyError):
+            del self.__dict__["_concrete_path"]
 
     def is_readable(self) -> bool:
         """check if the image file is readable"""
-        concrete_path = Path(ImageProvider.path_from_uri(self.uri))
-        return concrete_path.is_file()
+        return bool(self._concrete_path.is_file())
 
     def is_changed(self) -> bool:
         """check if image_data is changed
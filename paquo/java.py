@@ -1,4 +1,5 @@
 import warnings
+from typing import Any
 
 from paquo._config import settings
 from paquo._config import to_kwargs
@@ -18,14 +19,16 @@ if settings.mock_backend:  # pragma: no cover
     from unittest.mock import create_autospec
 
     start_jvm = create_autospec(start_jvm, return_value=MIN_QUPATH_VERSION)
+
+    class _JClassType(type):
+        def __getattr__(cls, key):
+            return MagicMock()
+
+    class _JClass(metaclass=_JClassType):
+        """mocked Java Class"""
+
     # noinspection PyPep8Naming
     def JClass(jc, *_args, **_kwargs):  # noqa
-        class _JClassType(type):
-            def __getattr__(cls, key):
-                return MagicMock()
-
-        class _JClass(metaclass=_JClassType):
-            f"""Java Class: {jc!r}"""
         return _JClass
 
 # ensure the jvm is running
@@ -38,6 +41,13 @@ elif qupath_version < MIN_QUPATH_VERSION:
     warnings.warn(f"QUPATH '{qupath_version}' IS UNTESTED OR UNSUPPORTED")  # pragma: no cover
 
 
+# version thresholds used by _Compatibility
+_QUPATH_VERSION_0_2_0_M10 = QuPathVersion("0.2.0-m10")
+_QUPATH_VERSION_0_2_0 = QuPathVersion("0.2.0")
+_QUPATH_VERSION_0_2_3 = QuPathVersion("0.2.3")
+_QUPATH_VERSION_0_4_0 = QuPathVersion("0.4.0")
+
+
 class _Compatibility:
     """organizes QuPath version differences"""
     def __init__(self, version: "QuPathVersion | None") -> None:
@@ -49,7 +59,7 @@ class _Compatibility:
         if self.version is None:
             return True
         else:
-            return self.version <= QuPathVersion("0.2.0")
+            return self.version <= _QUPATH_VERSION_0_2_0
 
     def requires_annotation_json_fix(self) -> bool:
         # annotations changed between QuPath "0.2.3" and "0.3.x"
@@ -57,7 +67,7 @@ class _Compatibility:
         if self.version is None:
             return True
         else:
-            return self.version <= QuPathVersion("0.2.3")
+            return self.version <= _QUPATH_VERSION_0_2_3
 
     def supports_image_server_recovery(self) -> bool:
         # image_server server.json files are only guaranteed to be written since QuPath "0.2.0"
@@ -65,7 +75,7 @@ class _Compatibility:
         if self.version is None:
             return False
         else:
-            return self.version >= QuPathVersion("0.2.0")
+            return self.version >= _QUPATH_VERSION_0_2_0
 
     def supports_logmanager(self) -> bool:
         # the logmanager class was only added with 0.2.0-m10
@@ -73,7 +83,7 @@ class _Compatibility:
         if self.version is None:
             return False
         else:
-            return self.version >= QuPathVersion("0.2.0-m10")
+            return self.version >= _QUPATH_VERSION_0_2_0_M10
 
     def supports_newer_addobject_and_pathclass(self) -> bool:
         # PathObjectHierarchy.addPathObject and .addPathObjectWithoutUpdate are deprecated
@@ -82,95 +92,125 @@ class _Compatibility:
         if self.version is None:
             return False
         else:
-            return self.version >= QuPathVersion("0.4.0")
+            return self.version >= _QUPATH_VERSION_0_4_0
 
 
 compatibility = _Compatibility(qupath_version)
 
 
-ArrayList = JClass("java.util.ArrayList")
-BufferedImage = JClass('java.awt.image.BufferedImage')
-ByteArrayOutputStream = JClass("java.io.ByteArrayOutputStream")
-File = JClass('java.io.File')
-Files = JClass('java.nio.file.Files')
-Integer = JClass('java.lang.Integer')
-PrintStream = JClass('java.io.PrintStream')
-StandardCharsets = JClass("java.nio.charset.StandardCharsets")
-String = JClass('java.lang.String')
-System = JClass('java.lang.System')
-URI = JClass('java.net.URI')
-
-ColorTools = JClass('qupath.lib.common.ColorTools')
-DefaultProject = JClass('qupath.lib.projects.DefaultProject')
-DefaultProjectImageEntry = JClass('qupath.lib.projects.DefaultProject.DefaultProjectImageEntry')
-GeneralTools = JClass("qupath.lib.common.GeneralTools")
-GeometryTools = JClass("qupath.lib.roi.GeometryTools")
-GsonTools = JClass('qupath.lib.io.GsonTools')
-ImageData = JClass('qupath.lib.images.ImageData')
-ImageType = JClass('qupath.lib.images.ImageData.ImageType')
-ImageServer = JClass('qupath.lib.images.servers.ImageServer')
-ImageServers = JClass('qupath.lib.images.servers.ImageServers')  # NOTE: this is needed to make QuPath v0.3.0-rc1 work
-ImageServerProvider = JClass('qupath.lib.images.servers.ImageServerProvider')
+# java classes are resolved lazily on first access via the module __getattr__
+_JCLASS_NAMES = {
+    "ArrayList": "java.util.ArrayList",
+    "BufferedImage": "java.awt.image.BufferedImage",
+    "ByteArrayOutputStream": "java.io.ByteArrayOutputStream",
+    "File": "java.io.File",
+    "Files": "java.nio.file.Files",
+    "Integer": "java.lang.Integer",
+    "PrintStream": "java.io.PrintStream",
+    "StandardCharsets": "java.nio.charset.StandardCharsets",
+    "String": "java.lang.String",
+    "System": "java.lang.System",
+    "URI": "java.net.URI",
+
+    "ColorTools": "qupath.lib.common.ColorTools",
+    "DefaultProject": "qupath.lib.projects.DefaultProject",
+    "DefaultProjectImageEntry": "qupath.lib.projects.DefaultProject.DefaultProjectImageEntry",
+    "GeneralTools": "qupath.lib.common.GeneralTools",
+    "GeometryTools": "qupath.lib.roi.GeometryTools",
+    "GsonTools": "qupath.lib.io.GsonTools",
+    "ImageData": "qupath.lib.images.ImageData",
+    "ImageType": "qupath.lib.images.ImageData.ImageType",
+    "ImageServer": "qupath.lib.images.servers.ImageServer",
+    "ImageServers": "qupath.lib.images.servers.ImageServers",  # NOTE: this is needed to make QuPath v0.3.0-rc1 work
+    "ImageServerProvider": "qupath.lib.images.servers.ImageServerProvider",
+
+    "PathAnnotationObject": "qupath.lib.objects.PathAnnotationObject",
+    "PathClass": "qupath.lib.objects.classes.PathClass",
+
+    "PathDetectionObject": "qupath.lib.objects.PathDetectionObject",
+    "PathIO": "qupath.lib.io.PathIO",
+    "PathObjectHierarchy": "qupath.lib.objects.hierarchy.PathObjectHierarchy",
+    "PathObjects": "qupath.lib.objects.PathObjects",
+    "PathROIObject": "qupath.lib.objects.PathROIObject",
+    "PathTileObject": "qupath.lib.objects.PathTileObject",
+    "PathCellObject": "qupath.lib.objects.PathCellObject",
+    "Point2": "qupath.lib.geom.Point2",
+    "ProjectIO": "qupath.lib.projects.ProjectIO",
+    "Projects": "qupath.lib.projects.Projects",
+    "ROI": "qupath.lib.roi.interfaces.ROI",
+    "ROIs": "qupath.lib.roi.ROIs",
+    "ServerTools": "qupath.lib.images.servers.ServerTools",
+
+    "EllipseROI": "qupath.lib.roi.EllipseROI",
+    "GeometryROI": "qupath.lib.roi.GeometryROI",
+    "LineROI": "qupath.lib.roi.LineROI",
+    "PointsROI": "qupath.lib.roi.PointsROI",
+    "PolygonROI": "qupath.lib.roi.PolygonROI",
+    "PolylineROI": "qupath.lib.roi.PolylineROI",
+    "RectangleROI": "qupath.lib.roi.RectangleROI",
+
+    "WKBWriter": "org.locationtech.jts.io.WKBWriter",
+    "WKBReader": "org.locationtech.jts.io.WKBReader",
+
+    "IOException": "java.io.IOException",
+    "ExceptionInInitializerError": "java.lang.ExceptionInInitializerError",
+    "URISyntaxException": "java.net.URISyntaxException",
+    "NegativeArraySizeException": "java.lang.NegativeArraySizeException",
+    "IllegalArgumentException": "java.lang.IllegalArgumentException",
+    "FileNotFoundException": "java.io.FileNotFoundException",
+    "NoSuchFileException": "java.nio.file.NoSuchFileException",
+}
+
+# optional classes: resolved lazily via __getattr__ or set to None below
+LogManager: Any
+PathClassFactory: Any
 
 if compatibility.supports_logmanager():
-    LogManager = JClass('qupath.lib.gui.logging.LogManager')
+    _JCLASS_NAMES["LogManager"] = "qupath.lib.gui.logging.LogManager"
 else:
     LogManager = None
 
-PathAnnotationObject = JClass("qupath.lib.objects.PathAnnotationObject")
-PathClass = JClass('qupath.lib.objects.classes.PathClass')
-
 if not compatibility.supports_newer_addobject_and_pathclass():
-    PathClassFactory = JClass('qupath.lib.objects.classes.PathClassFactory')
+    _JCLASS_NAMES["PathClassFactory"] = "qupath.lib.objects.classes.PathClassFactory"
 else:
     PathClassFactory = None
 
-PathDetectionObject = JClass("qupath.lib.objects.PathDetectionObject")
-PathIO = JClass("qupath.lib.io.PathIO")
-PathObjectHierarchy = JClass('qupath.lib.objects.hierarchy.PathObjectHierarchy')
-PathObjects = JClass("qupath.lib.objects.PathObjects")
-PathROIObject = JClass("qupath.lib.objects.PathROIObject")
-PathTileObject = JClass("qupath.lib.objects.PathTileObject")
-PathCellObject = JClass("qupath.lib.objects.PathCellObject")
-Point2 = JClass("qupath.lib.geom.Point2")
-ProjectIO = JClass('qupath.lib.projects.ProjectIO')
-Projects = JClass('qupath.lib.projects.Projects')
-ROI = JClass("qupath.lib.roi.interfaces.ROI")
-ROIs = JClass("qupath.lib.roi.ROIs")
-ServerTools = JClass('qupath.lib.images.servers.ServerTools')
-
-EllipseROI = JClass("qupath.lib.roi.EllipseROI")
-GeometryROI = JClass("qupath.lib.roi.GeometryROI")
-LineROI = JClass("qupath.lib.roi.LineROI")
-PointsROI = JClass("qupath.lib.roi.PointsROI")
-PolygonROI = JClass("qupath.lib.roi.PolygonROI")
-PolylineROI = JClass("qupath.lib.roi.PolylineROI")
-RectangleROI = JClass("qupath.lib.roi.RectangleROI")
-
-WKBWriter = JClass("org.locationtech.jts.io.WKBWriter")
-WKBReader = JClass("org.locationtech.jts.io.WKBReader")
-
-IOException = JClass("java.io.IOException")
-ExceptionInInitializerError = JClass("java.lang.ExceptionInInitializerError")
-URISyntaxException = JClass("java.net.URISyntaxException")
-NegativeArraySizeException = JClass('java.lang.NegativeArraySizeException')
-IllegalArgumentException = JClass('java.lang.IllegalArgumentException')
-FileNotFoundException = JClass('java.io.FileNotFoundException')
-NoSuchFileException = JClass('java.nio.file.NoSuchFileException')
-
-
-def __getattr__(name):
-    """lazy import some"""
-    if name == "ProjectImportImagesCommand":
+
+# classes that are resolved without running their static initializers.
+# the jvm initializes them on first real use (static call or instantiation)
+_JCLASS_NO_INIT = frozenset({
+    "GsonTools",
+    "EllipseROI",
+    "GeometryROI",
+    "LineROI",
+    "PointsROI",
+    "PolygonROI",
+    "PolylineROI",
+    "RectangleROI",
+})
+
+
+def __getattr__(name: str) -> Any:
+    """lazy import java classes"""
+    if name in _JCLASS_NAMES:
+        cls = globals()[name] = JClass(
+            _JCLASS_NAMES[name], initialize=name not in _JCLASS_NO_INIT
+        )
+        return cls
+    elif name == "ProjectImportImagesCommand":
         warnings.warn(
             "ProjectImportImagesCommand will be removed from paquo.java",
             DeprecationWarning
         )
-        return JClass('qupath.lib.gui.commands.ProjectImportImagesCommand')
+        return JClass('qupath.lib.gui.commands.ProjectImportImagesCommand', initialize=False)
     else:
         raise AttributeError(name)
 
 
+def __dir__():
+    return sorted({*globals(), *_JCLASS_NAMES})
+
+
 # noinspection PyPep8Naming
 def ProjectImportImagesCommand_getThumbnailRGB(server, _):
     # needs to be lazily imported to not emit threading info message
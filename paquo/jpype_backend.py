@@ -1,9 +1,8 @@
 import os
 import platform
 import re
-import shlex
+import stat
 import sys
-import textwrap
 from contextlib import contextmanager
 from contextlib import nullcontext
 from itertools import chain
@@ -31,6 +30,8 @@ __all__ = ["JClass", "start_jvm", "find_qupath"]
 
 JClass = jpype.JClass
 
+_SYSTEM = platform.system()
+
 
 class QuPathJVMInfo(NamedTuple):
     app_dir: Path
@@ -61,6 +62,7 @@ def find_qupath(*,
     if java_opts is None:
         java_opts = []
     elif isinstance(java_opts, str):
+        import shlex  # only needed for java_opts provided as a string
         java_opts = shlex.split(java_opts)
 
     if jvm_path_override:
@@ -113,55 +115,90 @@ def find_qupath(*,
 
 def _scan_qupath_dirs(qupath_search_dirs: List[PathOrStr], qupath_search_dir_regex: str) -> Iterable[Path]:
     """return potential paths for QuPath"""
-    qp_match = re.compile(qupath_search_dir_regex).match
-    for location in map(Path, qupath_search_dirs):
-        if not location.is_dir():
+    # an empty regex matches everything
+    qp_match = re.compile(qupath_search_dir_regex).match if qupath_search_dir_regex else None
+    for location in (os.fspath(d) for d in qupath_search_dirs):
+        if not os.path.isdir(location):
             continue
-        with os.scandir(location.absolute()) as it:
-            for dir_entry in sorted(it, key=lambda x: x.name.lower(), reverse=True):
-                if dir_entry.is_dir() and qp_match(dir_entry.name):
-                    yield Path(dir_entry.path)
+        if not os.path.isabs(location):
+            location = os.path.join(os.getcwd(), location)
+        with os.scandir(location) as it:
+            # match names first, so only candidates get sorted and stat-ed
+            if qp_match is None:
+                candidates = list(it)
+            else:
+                candidates = [dir_entry for dir_entry in it if qp_match(dir_entry.name)]
+        for dir_entry in sorted(candidates, key=lambda x: x.name.lower(), reverse=True):
+            if dir_entry.is_dir():
+                yield Path(dir_entry.path)
+
+
+# conda qupath locations per platform relative to CONDA_PREFIX
+_CONDA_QUPATH_DIRS = {
+    "Linux": ("opt", "QuPath"),
+    "Darwin": ("bin", "QuPath.app"),
+    "Windows": ("Library", "QuPath"),
+}
 
 
 def _conda_qupath_dir() -> Optional[Path]:
     """return the conda qupath if running in a conda env"""
     prefix = os.environ.get('CONDA_PREFIX')
     if prefix:
-        system = platform.system()
-        if system == "Linux":
-            return Path(prefix) / "opt" / "QuPath"
-        elif system == "Darwin":
-            return Path(prefix) / "bin" / "QuPath.app"
-        elif system == "Windows":
-            return Path(prefix) / "Library" / "QuPath"
-        else:  # pragma: no cover
-            raise ValueError(f'Unknown platform {system}')
+        try:
+            parts = _CONDA_QUPATH_DIRS[_SYSTEM]
+        except KeyError:  # pragma: no cover
+            raise ValueError(f'Unknown platform {_SYSTEM}')
+        return Path(prefix).joinpath(*parts)
     return None
 
 
-def qupath_jvm_info_from_qupath_dir(qupath_dir: Path, jvm_options: List[str]) -> QuPathJVMInfo:
-    """convert qupath_dir to paths according to platform"""
-    system = platform.system()
-    if system == "Linux":
-        app_dir = qupath_dir / "lib" / "app"
-        runtime_dir = qupath_dir / "lib" / "runtime"
-        jvm_path = runtime_dir / "lib" / "server" / "libjvm.so"
+# qupath_dir layouts per platform: (app_dir, runtime_dir, jvm_path relative to runtime_dir)
+_QUPATH_DIR_LAYOUTS = {
+    "Linux": (
+        ("lib", "app"),
+        ("lib", "runtime"),
+        ("lib", "server", "libjvm.so"),
+    ),
+    "Darwin": (
+        ("Contents", "app"),
+        ("Contents", "runtime", "Contents", "Home"),
+        ("lib", "libjli.dylib"),  # not server/libjvm.dylib
+    ),
+    "Windows": (
+        ("app",),
+        ("runtime",),
+        ("bin", "server", "jvm.dll"),
+    ),
+}
+
+
+def _is_dir(path: str) -> bool:
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
 
-    elif system == "Darwin":
-        app_dir = qupath_dir / "Contents" / "app"
-        runtime_dir = qupath_dir / "Contents" / "runtime" / "Contents" / "Home"
-        jvm_path = runtime_dir / "lib" / "libjli.dylib"  # not server/libjvm.dylib
+def _is_file(path: str) -> bool:
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
 
-    elif system == "Windows":
-        app_dir = qupath_dir / "app"
-        runtime_dir = qupath_dir / "runtime"
-        jvm_path = runtime_dir / "bin" / "server" / "jvm.dll"
 
-    else:  # pragma: no cover
-        raise ValueError(f'Unknown platform {system}')
+def qupath_jvm_info_from_qupath_dir(qupath_dir: Path, jvm_options: List[str]) -> QuPathJVMInfo:
+    """convert qupath_dir to paths according to platform"""
+    try:
+        app_parts, runtime_parts, jvm_parts = _QUPATH_DIR_LAYOUTS[_SYSTEM]
+    except KeyError:  # pragma: no cover
+        raise ValueError(f'Unknown platform {_SYSTEM}')
+    app_dir = qupath_dir.joinpath(*app_parts)
+    runtime_dir = qupath_dir.joinpath(*runtime_parts)
+    jvm_path = runtime_dir.joinpath(*jvm_parts)
 
     # verify that paths are sane
-    if not (app_dir.is_dir() and runtime_dir.is_dir() and jvm_path.is_file()):
+    if not (_is_dir(str(app_dir)) and _is_dir(str(runtime_dir)) and _is_file(str(jvm_path))):
         raise FileNotFoundError('qupath installation is incompatible')
 
     # Add java.library.path so that the qupath provided openslide works
@@ -198,7 +235,7 @@ def start_jvm(
     app_dir, runtime_dir, jvm_path, jvm_options = finder(**finder_kwargs)
 
     patched_env: Callable[[], ContextManager[Any]]
-    if platform.system() == "Windows":
+    if _SYSTEM == "Windows":
         # workaround for EXCEPTION_ACCESS_VIOLATION crash
         # see: https://github.com/bayer-science-for-a-better-life/paquo/issues/67
         @contextmanager
@@ -257,7 +294,7 @@ def start_jvm(
                 and jvm_path.is_file()
                 and platform.uname().machine == "arm64"
             ):
-                msg = textwrap.dedent("""\
+                msg = dedent("""\
                 Probably a JVM and Python architecture issue on M1:
                 You can fix this by running a JVM with the same architecture as your
                 Python interpreter. Usually paquo uses the JVM that ships with QuPath,
@@ -1,6 +1,7 @@
 import json
 import math
 from collections.abc import MutableMapping
+from functools import lru_cache
 from functools import partial
 from typing import Callable
 from typing import Iterator
@@ -40,6 +41,12 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=1)
+def _gson():
+    """return the shared qupath gson instance"""
+    return GsonTools.getInstance()
+
+
 def _shapely_geometry_to_qupath_roi(geometry: BaseGeometry, image_plane=None) -> ROI:
     """convert a shapely geometry into a qupath ROI
 
@@ -195,13 +202,13 @@ class _PathROIObject:
     @classmethod
     def from_geojson(cls: Type[PathROIObjectType], geojson) -> PathROIObjectType:
         """create a new Path Object from geojson"""
-        gson = GsonTools.getInstance()
+        gson = _gson()
         java_obj = gson.fromJson(String(json.dumps(geojson)), cls.java_class)
         return cls(java_obj)
 
     def to_geojson(self) -> dict:
         """convert the annotation object to geojson"""
-        gson = GsonTools.getInstance()
+        gson = _gson()
         geojson = gson.toJson(self.java_object)
         return dict(json.loads(str(geojson)))
 
@@ -5,6 +5,7 @@ import re
 import shutil
 from contextlib import contextmanager
 from contextlib import nullcontext
+from contextlib import suppress
 from typing import Any
 from typing import Callable
 from typing import ContextManager
@@ -22,6 +23,7 @@ from typing import overload
 from paquo import settings
 from paquo._logging import get_logger
 from paquo._logging import redirect
+from paquo._utils import cached_property
 from paquo._utils import make_backup_filename
 from paquo.classes import QuPathPathClass
 from paquo.images import ImageProvider
@@ -57,6 +59,8 @@ class _ProjectImageEntriesProxy(collections_abc.Sequence):
         if not isinstance(project.java_object, DefaultProject):
             raise TypeError('requires DefaultProject instance')  # pragma: no cover
         self._project = project
+        # the project path of a DefaultProject is fixed at construction
+        self._project_path = str(project.java_object.getPath().toAbsolutePath())
         self._images = {
             self._key_func(entry): QuPathProjectImageEntry(entry, _project_ref=self._project)
             for entry in self._project.java_object.getImageList()
@@ -70,7 +74,7 @@ class _ProjectImageEntriesProxy(collections_abc.Sequence):
         # basically `DefaultProjectImageEntry.getFullProjectEntryID()`
         # but don't go via image_data
         return (
-            str(self._project.java_object.getPath().toAbsolutePath().toString()),
+            self._project_path,
             str(entry.getID()),
         )
 
@@ -455,6 +459,8 @@ class QuPathProject:
         # update uris if possible
         for image in self.images:
             image.java_object.updateServerURIs(uri2uri)
+            # noinspection PyProtectedMember
+            image._uri_invalidate_cache()
 
     @redirect(stderr=True, stdout=True)
     def remove_image(
@@ -483,10 +489,10 @@ class QuPathProject:
             self._image_entries_proxy.refresh()
             self.save(images=False)
 
-    @property
+    @cached_property
     def uri(self) -> str:
         """the uri identifying the project location"""
-        return str(self.java_object.getURI().toString())
+        return str(self.java_object.getURI())
 
     # @property
     # def uri_previous(self) -> Optional[str]:
@@ -496,10 +502,18 @@ class QuPathProject:
     #         return None
     #     return str(uri.toString())
 
+    @cached_property
+    def _path_classes(self) -> Tuple[QuPathPathClass, ...]:
+        return tuple(map(QuPathPathClass.from_java, self.java_object.getPathClasses()))
+
+    def _path_classes_invalidate_cache(self):
+        with suppress(KeyError):
+            del self.__dict__["_path_classes"]
+
     @property
     def path_classes(self) -> Tuple[QuPathPathClass, ...]:
         """return path_classes stored in the project"""
-        return tuple(map(QuPathPathClass.from_java, self.java_object.getPathClasses()))
+        return self._path_classes
 
     @path_classes.setter
     def path_classes(self, path_classes: Iterable[QuPathPathClass]):
@@ -508,6 +522,7 @@ class QuPathProject:
             raise AttributeError("project in readonly mode")
         pcs = [pc.java_object for pc in path_classes]
         self.java_object.setPathClasses(pcs)
+        self._path_classes_invalidate_cache()
 
     @property
     def path(self) -> pathlib.Path:
@@ -88,3 +88,10 @@ def test_hexcolor():
         QuPathColor.from_hex("abc")
 
     assert qc == QuPathColor.from_any(c0)
+
+
+def test_from_java_rgba_signed_int():
+    # java ints are signed, so opaque colors arrive as negative numbers
+    argb = -16711165  # 0xFF010203
+    assert QuPathColor.from_java_rgba(argb) == QuPathColor(1, 2, 3, 255)
+    assert QuPathColor.from_java_rgb(argb) == QuPathColor(1, 2, 3)
@@ -1,3 +1,4 @@
+import logging
 import platform
 import shutil
 import sys
@@ -167,6 +168,14 @@ def test_imagedata_saving_for_removed_images_without_type(project_with_removed_i
         assert not (entry.entry_path / "data.qpdata").is_file()
 
 
+def test_imagedata_saving_for_removed_images_only_warns(project_with_removed_image_without_image_data, caplog):
+    with QuPathProject(project_with_removed_image_without_image_data, mode='r+') as qp:
+        entry = qp.images[0]
+        with caplog.at_level(logging.WARNING, logger="paquo.images"):
+            entry.save()
+    assert "not reachable" in caplog.text
+
+
 def test_readonly_recovery_hierarchy(project_with_removed_image_without_image_data):
     with QuPathProject(project_with_removed_image_without_image_data, mode='r+') as qp:
         entry = qp.images[0]
@@ -334,6 +343,39 @@ def test_image_provider_path_from_uri(uri: str, path: Path):
     assert c_path.parts == path.parts
 
 
+def test_image_provider_uri_string_hash():
+    a = ImageProvider.URIString("file:/C:/ABC%20ABC/image.svs")
+    b = ImageProvider.URIString("file:///C:/ABC%20ABC/image.svs")
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+
+
+def test_image_provider_uri_string_plain_str_keys(tmp_path):
+    p = tmp_path / "image.svs"
+    p.touch()
+    uri = ImageProvider().uri(p)
+    assert uri == p.as_uri()
+    # the string value is canonical, so it hashes like its plain str
+    assert uri in {str(uri)}
+    assert {str(uri): 1}[uri] == 1
+    assert {uri: 1}[str(uri)] == 1
+    assert ImageProvider.URIString(p.as_uri()) in {uri}
+
+
+def test_image_provider_uri_string_unquotable():
+    # the quoted retry is still invalid, so the raw string is used as-is
+    uri = ImageProvider.URIString("file:/a b?c d")
+    assert uri == "file:/a b?c d"
+
+
+def test_image_provider_rebase_normalized_keys():
+    ip = ImageProvider()
+    uri2uri = {"file:///C:/ABC%20ABC/image.svs": "file:/D:/image.svs"}
+    assert ip.rebase("file:/C:/ABC%20ABC/image.svs", uri2uri=uri2uri) == ["file:/D:/image.svs"]
+    assert ip.rebase("file:/C:/other.svs", uri2uri=uri2uri) == [None]
+
+
 def test_image_provider_uri_from_relpath_and_abspath():
     with pytest.raises(ValueError):
         ImageProvider.uri_from_path(Path('./abc.svs'))
@@ -159,6 +159,14 @@ def test_project_add_path_classes(new_project):
     assert {c.name for c in new_project.path_classes} == names
 
 
+def test_project_path_classes_cache(new_project):
+    from paquo.classes import QuPathPathClass
+
+    assert new_project.path_classes is new_project.path_classes
+    new_project.path_classes = [QuPathPathClass('a')]
+    assert [c.name for c in new_project.path_classes] == ['a']
+
+
 def test_download_svs(svs_small):
     assert svs_small.is_file()
 
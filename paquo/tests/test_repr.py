@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 import shapely.geometry
 
-from paquo._repr import repr_html, repr_svg
+from paquo._repr import css, div, h4, repr_html, repr_svg
 from paquo.colors import QuPathColor
 from paquo.images import QuPathProjectImageEntry
 from paquo.pathobjects import QuPathPathAnnotationObject
@@ -31,6 +31,12 @@ def test_repr_helper_fallback():
     assert repr(obj_without_ipynb_repr) == repr_svg(obj_without_ipynb_repr)
 
 
+def test_repr_helper_preserialized_style():
+    style = {"margin-top": "0", "color": "red"}
+    assert div(style=css(style)) == div(style=style)
+    assert h4(text="x", style=css(style)) == h4(text="x", style=style)
+
+
 def test_ipython_repr(new_project):
     assert new_project._repr_html_()
 